@@ -15,7 +15,7 @@
 import copy
 import json
 import os
-from collections import OrderedDict
+from operator import itemgetter
 
 import numpy as np
 import paddle
@@ -54,7 +54,7 @@ def filter_sharded_params(state_dict, optimizer, sharding_rank):
     optimizer = unwrap_optimizer(optimizer, DygraphShardingOptimizer)
     if optimizer is None:
         return state_dict
-    filtered_state_dict = OrderedDict()
+    filtered_state_dict = {}
     for (k, v) in state_dict.items():
         assert v.name in optimizer._param2rank
         sharded_rank = optimizer._param2rank[v.name]
@@ -116,7 +116,7 @@ class ShardingIO:
         self.args.tensor_parallel_degree == mp_degree
         cur_sharding_degree = self.args.sharding_parallel_degree
 
-        state_dict = OrderedDict()
+        state_dict = {}
 
         for i in range(self.args.sharding_parallel_rank, sharding_degree, cur_sharding_degree):
             tmp = self._load_one_state_dict_from_checkpoint(
@@ -186,8 +186,8 @@ class ShardingIO:
             logger.info("do not need reshard")
             return self._load_optimizer_state_of_one_shard(checkpoint, base_opt_name, self.args.optimizer_name_suffix)
         logger.info("reshard optimizer state")
-        state_dict = OrderedDict()
-        master_weights = OrderedDict()
+        state_dict = {}
+        master_weights = {}
         lr_scheduler = {}
 
         for i in range(self.args.sharding_parallel_rank, sharding_degree, cur_sharding_degree):
@@ -220,10 +220,11 @@ class ShardingIO:
 
         optimizer = unwrap_optimizer(self.optimizer, DygraphShardingOptimizer)
         param2rank = optimizer._param2rank
+        sharding_rank = self.args.sharding_parallel_rank
 
         def all_gather_state_dict(state_dict, filter_func):
             remote_state_dict_keys = [k for k in state_dict.keys() if not filter_func(k)]
-            tmp_state_dict = OrderedDict()
+            tmp_state_dict = {}
             for k in remote_state_dict_keys:
                 tmp_state_dict[k] = state_dict[k]
                 state_dict.pop(k)
@@ -232,11 +233,9 @@ class ShardingIO:
                 state_dict[k] = v
             return state_dict
 
+        # opt_to_p covers every gathered optimizer state name and maps it to a key of param2rank
         def opt_filter_func(name):
-            assert name in opt_to_p, f"name {name} not in opt_to_p"
-            param_name = opt_to_p[name]
-            assert param_name in param2rank, f"param_name {param_name} not in param2rank param2"
-            return param2rank[param_name] == self.args.sharding_parallel_rank
+            return param2rank[opt_to_p[name]] == sharding_rank
 
         state_dict = all_gather_state_dict(state_dict, opt_filter_func)
 
@@ -244,7 +243,7 @@ class ShardingIO:
             assert (name in param2rank) or (name in opt_to_p), f"name {name} not in param2rank or opt_to_p"
             if name in opt_to_p:
                 name = opt_to_p[name]
-            return param2rank[name] == self.args.sharding_parallel_rank
+            return param2rank[name] == sharding_rank
 
         # master weights
         master_weights = all_gather_state_dict(master_weights, master_weights_filter_func)
@@ -295,8 +294,8 @@ class ShardingIO:
                 state_dict, param_names_in_master_weights, self.sharding_group
             )
             logger.info(
-                "param_names_in_master_weights len:{}, bf16 state_dict len:{}, :{}".format(
-                    len(param_names_in_master_weights), len(state_dict), state_dict
+                "param_names_in_master_weights len:{}, bf16 state_dict len:{}".format(
+                    len(param_names_in_master_weights), len(state_dict)
                 )
             )
         return state_dict, config_to_save, weight_name_suffix
@@ -442,7 +441,7 @@ class ShardingIO:
     def _all_gather_state_dict(self, state_dict, filter_func, group=None):
         if group is None:
             group = self.hcg.get_sharding_parallel_group()
-        res = OrderedDict()
+        res = {}
 
         def map_func(weight):
             if isinstance(weight, paddle.Tensor):
@@ -465,7 +464,7 @@ class ShardingIO:
                 total_meta_dict[k] = v
 
         meta_list = list(total_meta_dict.items())
-        meta_list = sorted(meta_list, key=lambda x: x[0])
+        meta_list.sort(key=itemgetter(0))
         for (k, meta) in meta_list:
             dtype, shape, rank = meta
             if rank == group.rank: